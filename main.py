@@ -1,14 +1,31 @@
 from duckduckgo_search import DDGS
 import requests
-from bs4 import BeautifulSoup
-from markdownify import markdownify
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import atexit
+import copy
+import hashlib
+import json
+import threading
 import time
+from collections.abc import AsyncGenerator, Generator
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import LRUCache, TTLCache
+import aiohttp
+import asyncio
+from urllib.parse import urlparse, urlunparse
+from lxml import etree
+from lxml import html as lxml_html
+from markdownify import markdownify
+import trafilatura
 import gradio as gr
 from gradio.themes import Soft
 import datetime
 from tzlocal import get_localzone
 import pytz
 import os
+import socket
+import httpx
 import openai
 from dotenv import load_dotenv
 
@@ -32,15 +49,197 @@ except ImportError:
 # Load environment variables from .env file (if it exists)
 load_dotenv()
 
+# Resolve the local timezone once; get_localzone() reads system files
+_LOCAL_TZ = get_localzone()
+
 # Get API configurations from environment variables with defaults
 OPENAI_API_URL = os.getenv("OPENAI_API_URL", "https://api.openai.com/v1")
 ACCESS_TOKEN = os.getenv("ACCESS_TOKEN", "")
 
-# Configure OpenAI client
+# Configure OpenAI client on a pooled HTTP/2 transport so concurrent
+# summarization calls multiplex over one warm TLS connection
+_HTTPX_CLIENT = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+    timeout=API_TIMEOUT
+)
+atexit.register(_HTTPX_CLIENT.close)
+
 openai_client = openai.OpenAI(
     base_url=OPENAI_API_URL,
-    api_key=ACCESS_TOKEN
+    api_key=ACCESS_TOKEN,
+    http_client=_HTTPX_CLIENT
+)
+
+# Browser-like user agent used for all webpage fetches
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Maximum number of webpage fetches in flight at once
+MAX_CONCURRENCY = 8
+
+# Minimum delay between successive requests to the same host (politeness)
+PER_HOST_DELAY = 0.25
+
+# Stop downloading a page after this many bytes; markdownify and the
+# summarizer never use more than this anyway
+MAX_FETCH_BYTES = 512 * 1024
+
+# Prebuilt result templates: one string-build per result via format_map,
+# with no indentation-only whitespace leaking into the markdown output
+_RESULT_TMPL_AI = (
+    '\n## {title}\n\n'
+    '**Link:** {href}\n\n'
+    '**AI Summary:**\n{ai_summary}\n\n'
+    '**Original Snippet:**\n{summary}\n\n'
+    '---\n'
 )
+_RESULT_TMPL = (
+    '\n## {title}\n\n'
+    '**Link:** {href}\n\n'
+    '**Summary:** {summary}\n\n'
+    '**Full Content:**\n{body}\n\n'
+    '---\n'
+)
+
+# Compiled XPath that matches every boilerplate element in one C-level pass
+_STRIP_ELEMENTS = etree.XPath('//script|//style|//nav|//footer|//header')
+
+# Shared HTTP session so repeated fetches reuse pooled keep-alive connections
+# instead of paying a new TCP+TLS handshake per request
+_SESSION = requests.Session()
+# Advertise brotli alongside gzip; with the brotli package installed both
+# requests and aiohttp decompress transparently
+_SESSION.headers.update({'User-Agent': USER_AGENT, 'Accept-Encoding': 'gzip, deflate, br'})
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+)
+_SESSION.mount('https://', _adapter)
+_SESSION.mount('http://', _adapter)
+atexit.register(_SESSION.close)
+
+# Shared worker pool for blocking request handlers, so one long-running
+# search never ties up Gradio's event loop
+_EXECUTOR = ThreadPoolExecutor(max_workers=16)
+atexit.register(_EXECUTOR.shutdown)
+
+def _canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL for deduplication: fold http into https, lowercase the
+    host, drop the fragment, tracking parameters and any trailing slash.
+
+    Args:
+        url (str): The URL to normalize
+
+    Returns:
+        str: The canonical form of the URL
+    """
+    parts = urlparse(url)
+    # Treat http and https twins as the same page for dedup purposes
+    scheme = parts.scheme.lower()
+    if scheme == 'http':
+        scheme = 'https'
+    query = '&'.join(
+        param for param in parts.query.split('&')
+        if param and not param.lower().startswith(('utm_', 'fbclid=', 'gclid='))
+    )
+    return urlunparse((scheme, parts.netloc.lower(), parts.path.rstrip('/'), parts.params, query, ''))
+
+# Per-host politeness: each host hands out request slots PER_HOST_DELAY
+# apart, so same-host bursts stay throttled while cross-host fetches run
+# at full parallelism. LRU-bounded so a long-running server doesn't
+# accumulate every host ever seen; evicting a stale timestamp is harmless
+# since max(now, ...) floors it on the next reservation.
+_HOST_NEXT_SLOT: LRUCache = LRUCache(maxsize=1024)
+_HOST_SLOT_LOCK = threading.Lock()
+
+def _reserve_host_slot(url: str) -> float:
+    """
+    Reserve the next polite request slot for the URL's host.
+
+    Args:
+        url (str): The URL about to be fetched
+
+    Returns:
+        float: Seconds the caller should wait before issuing the request
+    """
+    host = urlparse(url).netloc
+    now = time.monotonic()
+    with _HOST_SLOT_LOCK:
+        slot = max(now, _HOST_NEXT_SLOT.get(host, now))
+        _HOST_NEXT_SLOT[host] = slot + PER_HOST_DELAY
+    return slot - now
+
+# Converted-markdown cache: a hit skips the download, parse and markdownify
+# entirely. The ETag store outlives the TTL so expired entries can be
+# revalidated with If-None-Match instead of re-downloading the body; it is
+# LRU-bounded so a long-running server doesn't accumulate every URL ever seen.
+_PAGE_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+_PAGE_CACHE_LOCK = threading.Lock()
+_ETAG_STORE: LRUCache = LRUCache(maxsize=1024)
+
+def _etag_entry(url: str) -> tuple[str, str] | None:
+    """Return the stored (etag, markdown) pair for a URL, if any."""
+    with _PAGE_CACHE_LOCK:
+        return _ETAG_STORE.get(url)
+
+# Search-results cache: repeated (query, n) calls skip both the DDG round-trip
+# and the whole fetch phase while the entry is fresh
+_SEARCH_CACHE: TTLCache = TTLCache(maxsize=512, ttl=600)
+_SEARCH_CACHE_LOCK = threading.Lock()
+
+# Summary cache: identical page bodies (static articles, repeated queries)
+# reuse the LLM response instead of paying another billed 2-10s call
+_SUMMARY_CACHE: TTLCache = TTLCache(maxsize=256, ttl=86400)
+_SUMMARY_CACHE_LOCK = threading.Lock()
+
+def _summary_cache_key(text: str, max_tokens: int) -> str:
+    """Build a summary cache key from the model, token budget and full text."""
+    return hashlib.blake2b(f'{DEFAULT_MODEL}|{max_tokens}|{text}'.encode(), digest_size=16).hexdigest()
+
+def _search_cache_key(query: str, n: int) -> str:
+    """Build a cache key from the normalized query and result count."""
+    normalized = query.strip().lower()
+    return hashlib.blake2b(f'{normalized}|{n}'.encode(), digest_size=16).hexdigest()
+
+def _cached_page(url: str) -> str | None:
+    """Return the cached markdown for a URL, or None on a cache miss."""
+    with _PAGE_CACHE_LOCK:
+        return _PAGE_CACHE.get(url)
+
+def _cache_page(url: str, markdown_content: str, etag: str | None) -> None:
+    """Store converted markdown (and its ETag, if any) for a URL."""
+    with _PAGE_CACHE_LOCK:
+        _PAGE_CACHE[url] = markdown_content
+        if etag:
+            _ETAG_STORE[url] = (etag, markdown_content)
+
+def _html_to_markdown(html: bytes) -> str:
+    """
+    Convert raw HTML bytes to markdown.
+
+    Tries trafilatura first, which extracts just the main article content,
+    so markdownify only ever sees the fragment that matters. Falls back to
+    the full strip-and-convert pass when extraction finds nothing.
+
+    Args:
+        html (bytes): The raw HTML to convert
+
+    Returns:
+        str: Markdown formatted content
+    """
+    extracted = trafilatura.extract(html, output_format='markdown', include_links=True, favor_precision=True)
+    if extracted:
+        return extracted
+
+    # Fallback: strip boilerplate elements and convert the whole document.
+    # drop_tree() reattaches each element's tail text, unlike a bare remove()
+    tree = lxml_html.fromstring(html)
+    for element in _STRIP_ELEMENTS(tree):
+        if element.getparent() is not None:
+            element.drop_tree()
+    return markdownify(lxml_html.tostring(tree, encoding='unicode'), heading_style="ATX")
 
 def fetch_webpage_content(url: str) -> str | None:
     """
@@ -52,21 +251,36 @@ def fetch_webpage_content(url: str) -> str | None:
     Returns:
         str | None: Markdown formatted content of the webpage or None if access is forbidden
     """
+    cached = _cached_page(url)
+    if cached is not None:
+        return cached
+
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
+        # Revalidate with If-None-Match when we saw an ETag for this URL before
+        headers = {}
+        etag_entry = _etag_entry(url)
+        if etag_entry:
+            headers['If-None-Match'] = etag_entry[0]
+
+        time.sleep(_reserve_host_slot(url))
+        response = _SESSION.get(url, headers=headers, timeout=10, stream=True)
+        if response.status_code == 304 and etag_entry:
+            response.close()
+            _cache_page(url, etag_entry[1], etag_entry[0])
+            return etag_entry[1]
         response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Remove unwanted elements
-        for element in soup(['script', 'style', 'nav', 'footer', 'header']):
-            element.decompose()
-            
-        # Convert to markdown
-        markdown_content = markdownify(str(soup), heading_style="ATX")
+
+        # Stream the body and stop at the byte budget instead of downloading
+        # multi-MB pages in full; iter_content decompresses gzip for us
+        buf = bytearray()
+        for chunk in response.iter_content(65536):
+            buf.extend(chunk)
+            if len(buf) >= MAX_FETCH_BYTES:
+                break
+        response.close()
+
+        markdown_content = _html_to_markdown(bytes(buf))
+        _cache_page(url, markdown_content, response.headers.get('ETag'))
         return markdown_content
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 403:
@@ -75,69 +289,221 @@ def fetch_webpage_content(url: str) -> str | None:
     except Exception as e:
         return f"Error fetching content: {str(e)}"
 
-def search(query: str, n: int = 5, summarize: bool = False) -> str:
+async def fetch_webpage_content_async(session: aiohttp.ClientSession, url: str) -> str | None:
+    """
+    Fetch and convert webpage content to markdown using a shared aiohttp session.
+
+    Args:
+        session (aiohttp.ClientSession): The session to fetch with
+        url (str): The URL to fetch
+
+    Returns:
+        str | None: Markdown formatted content of the webpage or None if access is forbidden
+    """
+    cached = _cached_page(url)
+    if cached is not None:
+        return cached
+
+    try:
+        # Revalidate with If-None-Match when we saw an ETag for this URL before
+        headers = {}
+        etag_entry = _etag_entry(url)
+        if etag_entry:
+            headers['If-None-Match'] = etag_entry[0]
+
+        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            if response.status == 304 and etag_entry:
+                _cache_page(url, etag_entry[1], etag_entry[0])
+                return etag_entry[1]
+            response.raise_for_status()
+            etag = response.headers.get('ETag')
+
+            # Stream the body and stop at the byte budget instead of
+            # downloading multi-MB pages in full
+            buf = bytearray()
+            async for chunk in response.content.iter_chunked(65536):
+                buf.extend(chunk)
+                if len(buf) >= MAX_FETCH_BYTES:
+                    break
+            html = bytes(buf)
+
+        markdown_content = _html_to_markdown(html)
+        _cache_page(url, markdown_content, etag)
+        return markdown_content
+    except aiohttp.ClientResponseError as e:
+        if e.status == 403:
+            return None
+        return f"Error fetching content: {str(e)}"
+    except Exception as e:
+        return f"Error fetching content: {str(e)}"
+
+async def _probe_url(session: aiohttp.ClientSession, url: str) -> bool:
+    """
+    Cheaply check with a HEAD request that a URL looks like a fetchable HTML
+    page, so we never spend a full GET on PDFs, videos or blocked pages.
+
+    Args:
+        session (aiohttp.ClientSession): The session to probe with
+        url (str): The URL to probe
+
+    Returns:
+        bool: True if the URL is worth a full fetch
+    """
+    try:
+        async with session.head(url, allow_redirects=True, timeout=aiohttp.ClientTimeout(total=5)) as response:
+            if response.status in (405, 501):
+                # Server doesn't support HEAD; let the GET decide
+                return True
+            if response.status != 200:
+                return False
+            if 'html' not in response.headers.get('Content-Type', ''):
+                return False
+            return int(response.headers.get('Content-Length', '0') or 0) < 5_000_000
+    except Exception:
+        # Probe failures are inconclusive; let the GET decide
+        return True
+
+async def _fetch_all_contents(urls: list[str]) -> list[str | None]:
+    """
+    Fetch all URLs concurrently, bounded by MAX_CONCURRENCY and staggering
+    requests to the same host by PER_HOST_DELAY to stay polite. URLs are
+    prefiltered with a cheap HEAD probe before any full GET is issued.
+
+    Args:
+        urls (list[str]): The URLs to fetch
+
+    Returns:
+        list[str | None]: Fetched contents in the same order as the input URLs
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def bounded_probe(session: aiohttp.ClientSession, url: str) -> bool:
+        # Cached pages already proved themselves fetchable
+        if _cached_page(url) is not None:
+            return True
+        # Probes count against the per-host budget too; without this, 2n
+        # simultaneous HEADs would undo the politeness the GETs observe
+        await asyncio.sleep(_reserve_host_slot(url))
+        async with semaphore:
+            return await _probe_url(session, url)
+
+    async def bounded_fetch(session: aiohttp.ClientSession, url: str) -> str | None:
+        # Skip the politeness wait when the page is already cached
+        if _cached_page(url) is None:
+            await asyncio.sleep(_reserve_host_slot(url))
+        async with semaphore:
+            return await fetch_webpage_content_async(session, url)
+
+    contents: list[str | None] = [None] * len(urls)
+    async with aiohttp.ClientSession(headers={'User-Agent': USER_AGENT, 'Accept-Encoding': 'gzip, deflate, br'}) as session:
+        probes = await asyncio.gather(
+            *[asyncio.create_task(bounded_probe(session, url)) for url in urls],
+            return_exceptions=True
+        )
+        tasks = {
+            i: asyncio.create_task(bounded_fetch(session, urls[i]))
+            for i, probe in enumerate(probes) if probe is True
+        }
+        fetched = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        for i, content in zip(tasks, fetched):
+            contents[i] = content if isinstance(content, str) else None
+
+    return contents
+
+def search(query: str, n: int = 5, summarize: bool = False) -> Generator[str, None, None]:
     """
     Perform a web search using DuckDuckGo and return the first n results.
-    
+
+    When summarization is enabled, the fetched results are yielded right away
+    with placeholder summaries so the user sees content immediately, and the
+    page is yielded again once the AI summaries arrive.
+
     Args:
         query (str): The search query
         n (int, optional): Number of results to return. Defaults to 5.
         summarize (bool, optional): Whether to summarize the content. Defaults to False.
-    
-    Returns:
+
+    Yields:
         str: Formatted search results as a markdown string
     """
-    with DDGS() as ddgs:
-        results = list(ddgs.text(query, max_results=n*2))
-    
-    # Process each result to add full content
-    valid_results = []
-    for result in results:
-        # Store the original snippet as summary
-        result['summary'] = result['body']
-        # Fetch and store the full content
-        content = fetch_webpage_content(result['href'])
-        if content is not None:  # Only include results that we can access
-            result['body'] = content
-            valid_results.append(result)
-            if len(valid_results) >= n:  # Stop once we have enough valid results
-                break
-        time.sleep(0.25)
-    
-    # Format the results for display
-    formatted_results = []
-    for i, result in enumerate(valid_results):
-        # If summarization is enabled and API key is available, summarize the content
-        if summarize and ACCESS_TOKEN:
-            print(f"Summarizing result {i+1}/{len(valid_results)}...")
-            ai_summary = summarize_text(result['body'])
-            content_section = f"""
-        **AI Summary:**
-        {ai_summary}
-        
-        **Original Snippet:**
-        {result['summary']}
-        """
-        else:
-            content_section = f"""
-        **Summary:** {result['summary']}
-        
-        **Full Content:**
-        {result['body']}
-        """
-            
-        formatted_result = f"""
-        ## {result['title']}
-        
-        **Link:** {result['href']}
-        
-        {content_section}
-        
-        ---
-        """
-        formatted_results.append(formatted_result)
+    # Reuse recent results for the same (query, n) instead of hitting DDG again
+    cache_key = _search_cache_key(query, n)
+    with _SEARCH_CACHE_LOCK:
+        cached_results = _SEARCH_CACHE.get(cache_key)
+
+    if cached_results is not None:
+        valid_results = copy.deepcopy(cached_results)
+    else:
+        with DDGS() as ddgs:
+            results = list(ddgs.text(query, max_results=n*2))
+
+        # Drop candidates whose canonical URL we already have, so http/https
+        # twins, tracking-parameter variants etc. only cost one fetch
+        seen_urls: set[str] = set()
+        deduped_results = []
+        for result in results:
+            canonical = _canonicalize_url(result['href'])
+            if canonical not in seen_urls:
+                seen_urls.add(canonical)
+                deduped_results.append(result)
+        results = deduped_results
+
+        # Fetch the full content of every candidate concurrently
+        contents = asyncio.run(_fetch_all_contents([result['href'] for result in results]))
+
+        # Process each result to add full content
+        valid_results = []
+        for result, content in zip(results, contents):
+            # Store the original snippet as summary
+            result['summary'] = result['body']
+            if content is not None:  # Only include results that we can access
+                result['body'] = content
+                valid_results.append(result)
+                if len(valid_results) >= n:  # Stop once we have enough valid results
+                    break
+
+        with _SEARCH_CACHE_LOCK:
+            _SEARCH_CACHE[cache_key] = copy.deepcopy(valid_results)
     
-    return "\n".join(formatted_results)
+    if not (summarize and ACCESS_TOKEN and valid_results):
+        yield ''.join(_RESULT_TMPL.format_map(result) for result in valid_results)
+        return
+
+    def render(ai_summaries: list[str]) -> str:
+        return ''.join(
+            _RESULT_TMPL_AI.format_map({**result, 'ai_summary': ai_summary})
+            for result, ai_summary in zip(valid_results, ai_summaries)
+        )
+
+    # Show the fetched content immediately; the summaries stream in afterwards
+    yield render(['*Summarizing...*'] * len(valid_results))
+
+    print(f"Summarizing {len(valid_results)} results...")
+    yield render(summarize_batch([result['body'] for result in valid_results]))
+
+_GEN_DONE = object()
+
+async def search_async(query: str, n: int = 5, summarize: bool = False) -> AsyncGenerator[str, None]:
+    """
+    Async wrapper around search that runs the blocking work on the shared
+    worker pool, keeping Gradio's event loop free for other users. Each
+    chunk the search generator produces is forwarded as soon as it is ready.
+
+    Args:
+        query (str): The search query
+        n (int, optional): Number of results to return. Defaults to 5.
+        summarize (bool, optional): Whether to summarize the content. Defaults to False.
+
+    Yields:
+        str: Formatted search results as a markdown string
+    """
+    loop = asyncio.get_running_loop()
+    generator = search(query, n, summarize)
+    while True:
+        chunk = await loop.run_in_executor(_EXECUTOR, next, generator, _GEN_DONE)
+        if chunk is _GEN_DONE:
+            break
+        yield chunk
 
 def get_datetime() -> str:
     """
@@ -146,10 +512,9 @@ def get_datetime() -> str:
     Returns:
         str: Formatted date and time string with timezone
     """
-    # Get current datetime with timezone info
-    now = datetime.datetime.now()
-    now = now.astimezone()  # Convert to local timezone
-    formatted_datetime = now.strftime(f"%A, %B %d, %Y %I:%M:%S %p %Z")
+    # Get current datetime in the cached local timezone
+    now = datetime.datetime.now(_LOCAL_TZ)
+    formatted_datetime = now.strftime("%A, %B %d, %Y %I:%M:%S %p %Z")
     return f"## Current Date and Time\n\n**{formatted_datetime}**"
 
 def scrape(url: str, summarize: bool = False) -> str:
@@ -205,12 +570,21 @@ def summarize_text(text: str, max_tokens: int = MAX_SUMMARY_TOKENS) -> str:
         if len(text) < MIN_SUMMARIZATION_LENGTH:
             return f"*Content is already concise ({len(text)} characters) and doesn't need summarization.*\n\n{text}"
             
+        # Return a memoized summary if we already summarized this exact
+        # content; the key is computed on the original text so the batched
+        # path can share entries
+        cache_key = _summary_cache_key(text, max_tokens)
+        with _SUMMARY_CACHE_LOCK:
+            cached_summary = _SUMMARY_CACHE.get(cache_key)
+        if cached_summary is not None:
+            return cached_summary
+
         # Truncate text if it's extremely long to avoid token limits
         truncated = False
         if len(text) > MAX_INPUT_CHARS:
             text = text[:MAX_INPUT_CHARS] + "..."
             truncated = True
-            
+
         # Add timeout for API calls
         response = openai_client.chat.completions.create(
             model=DEFAULT_MODEL,
@@ -228,7 +602,10 @@ def summarize_text(text: str, max_tokens: int = MAX_SUMMARY_TOKENS) -> str:
         # Add note if content was truncated
         if truncated:
             summary = summary + "\n\n*Note: The original content was truncated due to length limitations before summarization.*"
-            
+
+        with _SUMMARY_CACHE_LOCK:
+            _SUMMARY_CACHE[cache_key] = summary
+
         return summary
     except openai.APITimeoutError:
         return "⚠️ **API Timeout Error**: The request to the OpenAI API timed out. Please try again later or with shorter content."
@@ -241,6 +618,89 @@ def summarize_text(text: str, max_tokens: int = MAX_SUMMARY_TOKENS) -> str:
     except Exception as e:
         return f"⚠️ **Error summarizing content**: {str(e)}"
 
+def summarize_batch(texts: list[str], max_tokens: int = MAX_SUMMARY_TOKENS) -> list[str]:
+    """
+    Summarize several texts with a single API round-trip.
+
+    Packs all documents into one prompt and asks the model for a JSON object
+    with one summary per document, which amortizes the per-request network
+    and prompt overhead across the whole batch. Falls back to concurrent
+    per-text summarize_text calls if the batched response cannot be parsed.
+
+    Args:
+        texts (list[str]): The text contents to summarize
+        max_tokens (int): Maximum tokens per individual summary
+
+    Returns:
+        list[str]: Summaries in the same order as the input texts
+    """
+    if not texts:
+        return []
+    if len(texts) == 1 or not ACCESS_TOKEN:
+        return [summarize_text(text, max_tokens) for text in texts]
+
+    # Serve memoized summaries from the cache; only the misses go to the API
+    keys = [_summary_cache_key(text, max_tokens) for text in texts]
+    with _SUMMARY_CACHE_LOCK:
+        summaries: list[str | None] = [_SUMMARY_CACHE.get(key) for key in keys]
+
+    # Texts too short to need summarization (including failed-fetch error
+    # bodies) never go to the API; mirror summarize_text's shortcut
+    for i, text in enumerate(texts):
+        if summaries[i] is None and len(text) < MIN_SUMMARIZATION_LENGTH:
+            summaries[i] = f"*Content is already concise ({len(text)} characters) and doesn't need summarization.*\n\n{text}"
+
+    misses = [i for i, summary in enumerate(summaries) if summary is None]
+    if not misses:
+        return summaries
+    if len(misses) == 1:
+        summaries[misses[0]] = summarize_text(texts[misses[0]], max_tokens)
+        return summaries
+
+    try:
+        # Split the input budget evenly so the combined prompt stays bounded
+        budget = max(MIN_SUMMARIZATION_LENGTH, MAX_INPUT_CHARS // len(misses))
+        sections = [f"--- DOCUMENT {i+1} ---\n{texts[miss][:budget]}" for i, miss in enumerate(misses)]
+        prompt = (
+            f"Summarize each of the following {len(misses)} documents individually. "
+            f"Return a JSON object of the form {{\"summaries\": [...]}} containing exactly "
+            f"{len(misses)} summary strings in the same order as the documents. "
+            "Preserve all key information, facts, and important details while making each text more concise.\n\n"
+            + "\n\n".join(sections)
+        )
+        response = openai_client.chat.completions.create(
+            model=DEFAULT_MODEL,
+            messages=[
+                {"role": "system", "content": "You are a helpful assistant that creates comprehensive summaries of web content and answers in JSON."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=max_tokens * len(misses),
+            timeout=API_TIMEOUT,
+            response_format={"type": "json_object"}
+        )
+        parsed = json.loads(str(response.choices[0].message.content))
+        batch_summaries = parsed.get("summaries", []) if isinstance(parsed, dict) else parsed
+        if (isinstance(batch_summaries, list) and len(batch_summaries) == len(misses)
+                and all(isinstance(summary, str) for summary in batch_summaries)):
+            with _SUMMARY_CACHE_LOCK:
+                for miss, summary in zip(misses, batch_summaries):
+                    # Flag truncation like summarize_text does, since the
+                    # per-doc budget cuts harder than MAX_INPUT_CHARS
+                    if len(texts[miss]) > budget:
+                        summary = summary + "\n\n*Note: The original content was truncated due to length limitations before summarization.*"
+                    summaries[miss] = summary
+                    _SUMMARY_CACHE[keys[miss]] = summary
+            return summaries
+        print("Batched summarization returned an unexpected shape, falling back to per-result calls")
+    except Exception as e:
+        print(f"Batched summarization failed, falling back to per-result calls: {str(e)}")
+
+    # summarize_text memoizes its own results under the same keys
+    with ThreadPoolExecutor(max_workers=len(misses)) as executor:
+        for miss, summary in zip(misses, executor.map(lambda i: summarize_text(texts[i], max_tokens), misses)):
+            summaries[miss] = summary
+    return summaries
+
 def check_api_connection() -> bool:
     """
     Check if the OpenAI API connection is working
@@ -252,15 +712,8 @@ def check_api_connection() -> bool:
         return False
         
     try:
-        # Send a minimal request to verify connection
-        response = openai_client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "user", "content": "Hello"}
-            ],
-            max_tokens=5
-        )
-        return True
+        # List models: a fast metadata call that costs no tokens
+        return next(iter(openai_client.models.list()), None) is not None
     except Exception as e:
         print(f"API connection error: {str(e)}")
         return False
@@ -271,7 +724,7 @@ def create_search_interface():
     """
     # Create the Gradio interface
     interface = gr.Interface(
-        fn=search,        
+        fn=search_async,
         inputs=[
             gr.Textbox(label="Search Query", placeholder="Enter your search query here..."),
             gr.Slider(minimum=1, maximum=10, value=5, step=1, label="Number of Results"),
@@ -341,8 +794,29 @@ def create_scrape_interface():
     
     return interface
 
+def _warmup() -> None:
+    """
+    Warm the connection pools and OS DNS cache in the background so the
+    first real query doesn't pay cold-start costs (DNS lookup, TCP+TLS
+    handshake, empty session-ticket cache).
+    """
+    for host in ('duckduckgo.com', 'html.duckduckgo.com', urlparse(OPENAI_API_URL).netloc):
+        try:
+            socket.getaddrinfo(host, 443)
+        except Exception:
+            pass
+    try:
+        # Leaves a warm keep-alive connection in the shared session pool;
+        # the OpenAI pool is warmed by check_api_connection at startup
+        _SESSION.head('https://duckduckgo.com', timeout=5)
+    except Exception:
+        pass
+
 def main():
     print("Starting server...")
+
+    # Warm connections and DNS while the interfaces are being built
+    threading.Thread(target=_warmup, daemon=True).start()
     
     # Check API configuration
     api_status = "API connection: "
@@ -375,6 +849,7 @@ def main():
             with gr.Tab("Scrape"):
                 scrape_interface.render()
     print("Interface created, launching server...")
+    demo.queue(default_concurrency_limit=8, max_size=64)
     demo.launch(
         mcp_server=True,
         server_name="0.0.0.0",  # Allow external connections